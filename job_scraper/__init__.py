@@ -19,20 +19,37 @@ Usage:
     # Configure concurrency
     from job_scraper import set_max_concurrent_browsers
     set_max_concurrent_browsers(2)  # Lower for Raspberry Pi
+    
+    # Configure per-site concurrency
+    from job_scraper import set_max_concurrent_per_site
+    set_max_concurrent_per_site("linkedin", 1)
 """
 
 # Main scraping functions
-from .camoufox_engine import scrape_offer, scrape_batch
+from .camoufox_engine import (
+    scrape_offer,
+    scrape_batch,
+    scrape_batch_iter,
+    on_low_memory,
+    shutdown_browsers,
+)
 
 # Config helpers
 from .config import (
     get_max_concurrent_browsers,
     set_max_concurrent_browsers,
+    get_max_concurrent_per_site,
+    set_max_concurrent_per_site,
 )
 
 __all__ = [
     "scrape_offer",
     "scrape_batch",
+    "scrape_batch_iter",
+    "on_low_memory",
+    "shutdown_browsers",
     "get_max_concurrent_browsers",
     "set_max_concurrent_browsers",
+    "get_max_concurrent_per_site",
+    "set_max_concurrent_per_site",
 ]
@@ -11,6 +11,18 @@ Usage:
     results = await scrape_batch([url1, url2, ...])
 """
 
-from .core import scrape_offer, scrape_batch
+from .core import (
+    scrape_offer,
+    scrape_batch,
+    scrape_batch_iter,
+    on_low_memory,
+    shutdown_browsers,
+)
 
-__all__ = ["scrape_offer", "scrape_batch"]
+__all__ = [
+    "scrape_offer",
+    "scrape_batch",
+    "scrape_batch_iter",
+    "on_low_memory",
+    "shutdown_browsers",
+]
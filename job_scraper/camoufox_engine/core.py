@@ -4,7 +4,9 @@ Core V2 scraping engine using Camoufox (AsyncCamoufox).
 Features:
 - Async/await interface for non-blocking scraping
 - Configurable semaphore limiting concurrent browsers (see config.py)
-- Headless stealth mode with humanize and geoip enabled
+- Per-site semaphores capping concurrent scrapes against one site
+- Pool of reusable browsers with one context per site, wiped between scrapes (see pool.py)
+- Headless stealth mode with configurable geoip (see config.py)
 - No xvfb required - works natively on macOS and Raspberry Pi
 - Same output schema as V1 engine for compatibility
 - Uses exact same extraction scripts as V1 for reliable data extraction
@@ -13,37 +15,94 @@ Features:
 import asyncio
 import os
 import re
+import sys
 import traceback
 from datetime import datetime
-from typing import Any, Dict, List
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import unquote_plus
+from weakref import WeakKeyDictionary
 
 # Suppress dock icon on macOS (must be set before importing browser)
 os.environ["MOZ_HEADLESS"] = "1"
 
-from camoufox.async_api import AsyncCamoufox
-
-from ..config import get_max_concurrent_browsers, SCRAPING_CONFIG
+from ..config import get_max_concurrent_browsers, get_max_concurrent_per_site, SCRAPING_CONFIG
+from .pool import BrowserPool
 
 # =============================================================================
 # GLOBAL SEMAPHORE - Limits concurrent browser instances to prevent OOM
-# Initialized lazily to respect config changes
+# One per event loop, so repeated asyncio.run() calls each get a fresh one
+# (and pick up the current concurrency limit)
 # =============================================================================
-_browser_semaphore = None
+_browser_semaphore: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
 
 
 def _get_semaphore() -> asyncio.Semaphore:
-    """Get or create the browser semaphore with configured limit."""
-    global _browser_semaphore
-    if _browser_semaphore is None:
-        _browser_semaphore = asyncio.Semaphore(get_max_concurrent_browsers())
-    return _browser_semaphore
+    """Get or create the browser semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _browser_semaphore.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(get_max_concurrent_browsers())
+        _browser_semaphore[loop] = sem
+    return sem
+
+
+# =============================================================================
+# PER-SITE SEMAPHORES - Cap concurrent scrapes against one site
+# One set per event loop, same as the global semaphore
+# =============================================================================
+_site_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = WeakKeyDictionary()
+
+
+def _get_site_semaphore(source: str) -> asyncio.Semaphore:
+    """Get or create the semaphore for `source` in the running event loop."""
+    loop = asyncio.get_running_loop()
+    sems = _site_semaphores.get(loop)
+    if sems is None:
+        sems = {}
+        _site_semaphores[loop] = sems
+    sem = sems.get(source)
+    if sem is None:
+        sem = asyncio.Semaphore(get_max_concurrent_per_site(source))
+        sems[source] = sem
+    return sem
+
+
+# =============================================================================
+# GLOBAL BROWSER POOL - Reuses launched browsers across scrapes
+# One per event loop, same as the semaphore
+# =============================================================================
+_browser_pool: "WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = WeakKeyDictionary()
+
 
+def _get_pool() -> BrowserPool:
+    """Get or create the browser pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _browser_pool.get(loop)
+    if pool is None:
+        pool = BrowserPool(get_max_concurrent_browsers())
+        _browser_pool[loop] = pool
+    return pool
 
-# Page load timeout in milliseconds (from config)
-PAGE_TIMEOUT_MS = SCRAPING_CONFIG["page_timeout_ms"]
+
+# Cap on loading, preparing and extracting one page in milliseconds (from config)
+SCRAPE_TIMEOUT_MS = SCRAPING_CONFIG["scrape_timeout_ms"]
+
+# Navigation timeout in milliseconds (from config); navigation runs inside
+# the scrape cap, so it never exceeds it
+PAGE_TIMEOUT_MS = min(SCRAPING_CONFIG["page_timeout_ms"], SCRAPE_TIMEOUT_MS)
+
+# Time the extraction script always gets, even once preparation used the cap
+EXTRACTION_GRACE_MS = 3000
+
+# Cap on each step of wiping a page after a scrape
+RESET_TIMEOUT_MS = 5000
+
+# Render wait after navigation in milliseconds (from config)
+READY_TIMEOUT_MS = SCRAPING_CONFIG["ready_timeout_ms"]
 
 # URL patterns for supported job sites
+# Deprecated: kept for backward compatibility, use _SITE_RE for matching
 URL_PATTERNS = {
     "justjoin": r"justjoin\.it",
     "theprotocol": r"theprotocol\.it",
@@ -51,6 +110,120 @@ URL_PATTERNS = {
     "linkedin": r"linkedin\.com/jobs",
 }
 
+# All site patterns as one alternation; the matching group name is the source
+_SITE_RE = re.compile(
+    "|".join(f"(?P<{source}>{pattern})" for source, pattern in URL_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+# Job id segment of a LinkedIn /jobs/view/<id> URL
+_LINKEDIN_JOB_ID_RE = re.compile(r"/jobs/view/([^/?]*)")
+
+# currentJobId query parameter of LinkedIn collection/search links
+_LINKEDIN_CURRENT_JOB_RE = re.compile(r"^[^#]*?[?&]currentJobId=([^&#]+)")
+
+
+# Resource types the extraction scripts never read - aborted before download
+# to cut bytes per page and Firefox memory per tab
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "beacon", "csp_report"})
+
+# Analytics/ad hosts aborted whatever the resource type
+_TRACKER_HOSTS = (
+    "doubleclick.net",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googlesyndication.com",
+    "hotjar.com",
+    "facebook.net",
+)
+_TRACKER_RE = re.compile(
+    r"^[a-z]+://(?:[^/?#]*\.)?(?:"
+    + "|".join(re.escape(host) for host in _TRACKER_HOSTS)
+    + r")(?:[:/?#]|$)",
+    re.IGNORECASE,
+)
+
+# Element whose presence means the offer has rendered, per source
+# (mirrors the title lookups in the extraction scripts below)
+_READY_SELECTORS = {
+    "justjoin": "h1",
+    "theprotocol": "[data-test='text-offerTitle'], h1",
+    "pracuj": "[data-test='text-positionName'], h1",
+    "linkedin": ".jobs-unified-top-card__job-title, h1.top-card-layout__title, h1",
+}
+
+# Page preparation done in a single evaluate, per source: cookie accept and
+# section expansion (sites with neither have no entry). A page without the
+# buttons costs one evaluate that finds nothing, so misses need no caching.
+# (theprotocol: buttons inside the consent banner are left alone)
+_PREP_SCRIPTS = {
+    "justjoin": """
+() => {
+    for (const b of document.querySelectorAll('button')) {
+        const label = (b.textContent || '').toLowerCase();
+        if (label.includes('accept') || label.includes('akceptuj')) {
+            b.click();
+            break;
+        }
+    }
+}
+""",
+    "theprotocol": """
+() => {
+    const accept = document.querySelector("#onetrust-accept-btn-handler, button[id*='accept']");
+    if (accept) accept.click();
+    // Section toggles when the page marks them; every button otherwise
+    let btns = document.querySelectorAll('button[data-test="button-toggle"]');
+    if (!btns.length) btns = document.querySelectorAll('button');
+    btns.forEach(b => {
+        if (b.closest('#onetrust-consent-sdk')) return;
+        const label = (b.textContent || '').toLowerCase();
+        if (label.includes('więcej') || label.includes('more')) b.click();
+    });
+}
+""",
+    "linkedin": """
+() => {
+    const btn = document.querySelector("button[aria-label*='more'], .jobs-description__footer-button, button.show-more-less-html__button--more");
+    if (btn) {
+        btn.scrollIntoView({block: 'center'});
+        btn.click();
+    }
+}
+""",
+}
+
+# Stylesheets injected after navigation, per source
+# (LinkedIn: hide the login wall so it neither blocks clicks nor pollutes text)
+_PAGE_STYLES = {
+    "linkedin": (
+        ".base-modal, .authwall-join-form__modal, .modal-overlay { display: none !important; }"
+        " body { overflow: auto !important; }"
+    ),
+}
+
+# Same overlays removed from the DOM, for pages that refuse the stylesheet
+# (e.g. a strict Content-Security-Policy)
+_PAGE_STYLE_FALLBACK_SCRIPTS = {
+    "linkedin": """
+() => {
+    const modal = document.querySelector('.base-modal, .authwall-join-form__modal');
+    if (modal) modal.remove();
+    const overlay = document.querySelector('.modal-overlay');
+    if (overlay) overlay.remove();
+    document.body.style.overflow = 'auto';
+}
+""",
+}
+
+# Wipes page storage between offers sharing one per-site context
+_CLEAR_STORAGE_SCRIPT = """
+() => {
+    try { localStorage.clear(); } catch (e) {}
+    try { sessionStorage.clear(); } catch (e) {}
+}
+"""
+
 
 # =============================================================================
 # SITE-SPECIFIC EXTRACTION SCRIPTS (ported from V1)
@@ -60,30 +233,52 @@ JUSTJOIN_EXTRACTION_SCRIPT = """
 (function() {
     var data = {};
     
+    // --- Helper: Short text without forcing layout (innerText would) ---
+    function t(el) {
+        return el ? (el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+    }
+    
     // --- Helper: Find text by icon ---
     function getTextByIcon(iconId) {
         var icon = document.querySelector('svg[data-testid="' + iconId + '"]');
         if (icon) {
             var parent = icon.parentElement;
-            if (parent) return parent.innerText.trim();
+            if (parent) return t(parent);
         }
         return null;
     }
 
+    // --- Structured data (ld+json), parsed once and shared by all fields ---
+    var LD = null;
+    var ldJsonScript = document.querySelector('script[type="application/ld+json"]');
+    if (ldJsonScript) {
+        try { LD = JSON.parse(ldJsonScript.textContent); } catch(e) {}
+    }
+
     // --- Title ---
     var h1 = document.querySelector('h1');
-    data.title = h1 ? h1.innerText.trim() : '';
+    data.title = t(h1);
     
     // --- Company ---
     var company = getTextByIcon('ApartmentRoundedIcon');
     if (!company) {
         var compLink = document.querySelector('a[href*="companies="]');
-        if (compLink) company = compLink.innerText.trim();
+        if (compLink) company = t(compLink);
     }
     data.company = company || '';
 
     // --- Salary ---
-    var salaryMatch = document.body.innerText.match(/(\\d[\\d\\s]*-(?:\\s*\\d[\\d\\s]*)?)\\s*(PLN|EUR|USD)/i);
+    // Try salary-looking elements first; serializing the whole body forces
+    // a full layout and allocates a page-sized string
+    var SALARY_RE = /(\\d[\\d\\s]*-(?:\\s*\\d[\\d\\s]*)?)\\s*(PLN|EUR|USD)/i;
+    var salaryMatch = null;
+    var salaryEls = document.querySelectorAll('[data-testid*="salary" i], [class*="salary" i], [class*="earnings" i]');
+    for (var i = 0; i < salaryEls.length && !salaryMatch; i++) {
+        salaryMatch = salaryEls[i].textContent.replace(/\\s+/g, ' ').match(SALARY_RE);
+    }
+    if (!salaryMatch) {
+        salaryMatch = document.body.innerText.match(SALARY_RE);
+    }
     if (salaryMatch) {
          data.salary = salaryMatch[0].trim();
     }
@@ -91,18 +286,12 @@ JUSTJOIN_EXTRACTION_SCRIPT = """
     // --- Location ---
     // Try to extract from ld+json structured data first (most reliable)
     var location = null;
-    var ldJsonScript = document.querySelector('script[type="application/ld+json"]');
-    if (ldJsonScript) {
-        try {
-            var ldJson = JSON.parse(ldJsonScript.textContent);
-            if (ldJson.jobLocation && ldJson.jobLocation.address) {
-                var addr = ldJson.jobLocation.address;
-                var parts = [];
-                if (addr.streetAddress) parts.push(addr.streetAddress);
-                if (addr.addressLocality) parts.push(addr.addressLocality);
-                if (parts.length > 0) location = parts.join(', ');
-            }
-        } catch(e) {}
+    if (LD && LD.jobLocation && LD.jobLocation.address) {
+        var addr = LD.jobLocation.address;
+        var parts = [];
+        if (addr.streetAddress) parts.push(addr.streetAddress);
+        if (addr.addressLocality) parts.push(addr.addressLocality);
+        if (parts.length > 0) location = parts.join(', ');
     }
     
     // Fallback: Find location as sibling to company icon container
@@ -117,7 +306,7 @@ JUSTJOIN_EXTRACTION_SCRIPT = """
                     var sib = siblings[i];
                     // Skip the company link itself and separators
                     if (sib.tagName === 'A' || sib.tagName === 'SPAN') continue;
-                    var sibText = sib.innerText.trim();
+                    var sibText = t(sib);
                     // Location typically contains comma or city name
                     if (sibText && sibText.length > 2 && sibText.length < 100) {
                         location = sibText;
@@ -135,60 +324,61 @@ JUSTJOIN_EXTRACTION_SCRIPT = """
     data.location = location;
 
     // --- Metadata Chips (Seniority, Mode, Type) ---
-    var allDivs = document.querySelectorAll('div, span');
-    var headerChips = [];
-    var modeChips = [];
-    var typeChips = [];
-    
-    for (var i = 0; i < allDivs.length; i++) {
-        var el = allDivs[i];
-        var txt = el.innerText;
-        if (txt.length > 20) continue;
-        
-        if (['Junior', 'Mid', 'Senior', 'C-level'].indexOf(txt) !== -1) headerChips.push(txt);
-        if (['Remote', 'Hybrid', 'Office'].indexOf(txt) !== -1) modeChips.push(txt);
-        if (['B2B', 'Permanent', 'Mandate contract'].indexOf(txt) !== -1) typeChips.push(txt);
-    }
-
-    if (headerChips.length > 0) data.experienceLevel = headerChips[0];
-    if (modeChips.length > 0) data.workMode = modeChips[0];
-    if (typeChips.length > 0) data.employmentType = typeChips[0];
+    // textContent avoids a layout flush per node; stop once all three are found
+    var SENIORITY = new Set(['Junior', 'Mid', 'Senior', 'C-level']);
+    var MODES = new Set(['Remote', 'Hybrid', 'Office']);
+    var TYPES = new Set(['B2B', 'Permanent', 'Mandate contract']);
     
-    // --- Description & Tech Stack ---
-    function getSectionContent(headerText) {
-        var headers = document.querySelectorAll('h1, h2, h3, h4, h5, h6, div');
-        for (var i = 0; i < headers.length; i++) {
-            var h = headers[i];
-            if (h.innerText.trim().toUpperCase() === headerText) {
-                var next = h.nextElementSibling;
-                if (next) return next.innerText.trim();
-            }
+    function scanChips(nodes) {
+        for (var i = 0; i < nodes.length; i++) {
+            var raw = nodes[i].textContent;
+            if (raw.length > 60) continue;
+            var txt = raw.trim();
+            if (txt.length > 20) continue;
+            
+            if (!data.experienceLevel && SENIORITY.has(txt)) data.experienceLevel = txt;
+            if (!data.workMode && MODES.has(txt)) data.workMode = txt;
+            if (!data.employmentType && TYPES.has(txt)) data.employmentType = txt;
+            if (data.experienceLevel && data.workMode && data.employmentType) return true;
         }
-        return null;
+        return false;
     }
-
-    var desc = getSectionContent('JOB DESCRIPTION') || '';
     
-    // Tech Stack
+    // Chip elements first; sweep every div/span only if a value is still missing
+    if (!scanChips(document.querySelectorAll('[class*="MuiChip"], [data-testid*="chip" i]'))) {
+        scanChips(document.querySelectorAll('div, span'));
+    }
+    
+    // --- Description & Tech Stack ---
+    // One pass over the candidate headers finds both sections; textContent
+    // avoids a layout flush per node
+    var descHeader = null;
     var techHeaderStub = null;
     var headers = document.querySelectorAll('h1, h2, h3, h4, h5, h6, div');
     for (var i = 0; i < headers.length; i++) {
-         if (headers[i].innerText.trim().toUpperCase() === 'TECH STACK') {
-             techHeaderStub = headers[i];
-             break;
-         }
+        var h = headers[i];
+        var raw = h.textContent;
+        if (raw.length > 60) continue;
+        var label = raw.trim().toUpperCase();
+        if (!descHeader && label === 'JOB DESCRIPTION' && h.nextElementSibling) descHeader = h;
+        if (!techHeaderStub && label === 'TECH STACK') techHeaderStub = h;
+        if (descHeader && techHeaderStub) break;
     }
-        
+
+    var desc = descHeader ? descHeader.nextElementSibling.innerText.trim() : '';
+    
+    // Tech Stack
     var techText = "";
     if (techHeaderStub) {
         var container = techHeaderStub.nextElementSibling;
         if (container) {
+            var STACK_SKIP = new Set(['Junior', 'Mid', 'Senior']);
             var rawStack = container.innerText.trim();
             var parts = rawStack.split('\\n');
             var filtered = [];
             for (var j=0; j<parts.length; j++) {
                 var p = parts[j];
-                if (p.length > 1 && ['Junior', 'Mid', 'Senior'].indexOf(p) === -1) {
+                if (p.length > 1 && !STACK_SKIP.has(p)) {
                     filtered.push(p);
                 }
             }
@@ -214,18 +404,29 @@ THEPROTOCOL_EXTRACTION_SCRIPT = """
 (function() {
     const data = {};
     
+    // Index every [data-test] element in one traversal (first match wins,
+    // same as querySelector)
+    const byTest = new Map();
+    document.querySelectorAll('[data-test]').forEach(el => {
+        if (!byTest.has(el.dataset.test)) byTest.set(el.dataset.test, el);
+    });
+    
+    // Short text without forcing layout (innerText would); multi-line
+    // fields keep innerText for its line breaks
+    const t = el => el ? (el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+    
     // Helper to get text from data-test
     function getTestText(testId) {
-        const el = document.querySelector(`[data-test="${testId}"]`);
-        return el ? el.innerText.trim() : null;
+        const el = byTest.get(testId);
+        return el ? t(el) : null;
     }
     
     // --- 1. Basic Metadata ---
-    data.title = getTestText('text-offerTitle') || document.querySelector('h1')?.innerText?.trim() || '';
+    data.title = getTestText('text-offerTitle') || t(document.querySelector('h1'));
     
     // Company (remove "Firma: " prefix if present)
     let company = getTestText('text-offerEmployer') || 
-                  document.querySelector('a[data-test="anchor-company-link"]')?.innerText.trim();
+                  t(document.querySelector('a[data-test="anchor-company-link"]'));
     if (company) {
         company = company.replace(/^(Firma|Company):\\s*/i, '');
     }
@@ -239,21 +440,21 @@ THEPROTOCOL_EXTRACTION_SCRIPT = """
     data.location = getTestText('text-primaryLocation');
     
     // Work Mode
-    const modeEl = document.querySelector('[data-test="content-workModes"]');
+    const modeEl = byTest.get('content-workModes');
     if (modeEl) {
         data.workMode = modeEl.innerText.replace(/\\n/g, ', ').trim();
     }
     
     // Experience / Seniority
-    const expEl = document.querySelector('[data-test="content-positionLevels"]');
+    const expEl = byTest.get('content-positionLevels');
     if (expEl) {
         data.experienceLevel = expEl.innerText.replace(/\\n/g, ', ').trim();
     }
     
     // Employment Type
-    const typeEl = document.querySelector('[data-test="text-contractName"]');
+    const typeEl = byTest.get('text-contractName');
     if (typeEl) {
-       data.employmentType = typeEl.innerText.trim();
+       data.employmentType = t(typeEl);
     }
     
     // --- 3. Structured Description ---
@@ -271,9 +472,9 @@ THEPROTOCOL_EXTRACTION_SCRIPT = """
     const descParts = [];
     
     sections.forEach(sec => {
-        const el = document.querySelector(`[data-test="${sec.id}"]`);
-        if (el && el.innerText.trim().length > 0) {
-            let text = el.innerText.trim();
+        const el = byTest.get(sec.id);
+        const text = el ? el.innerText.trim() : '';
+        if (text.length > 0) {
             descParts.push(text);
         }
     });
@@ -291,50 +492,71 @@ THEPROTOCOL_EXTRACTION_SCRIPT = """
 LINKEDIN_EXTRACTION_SCRIPT = """
 (function() {
     const data = {};
-    const bodyText = document.body.innerText;
     
-    // --- 0. Remove login modal if present ---
-    const modal = document.querySelector('.base-modal, .authwall-join-form__modal');
-    if (modal) modal.remove();
-    const overlay = document.querySelector('.modal-overlay');
-    if (overlay) overlay.remove();
-    document.body.style.overflow = 'auto';
+    // Short text without forcing layout (innerText would); multi-line
+    // fields keep innerText for its line breaks
+    const t = el => el ? (el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+    
+    // Patterns used per top-card entry, compiled once
+    const MODE_RE = /\\(?(Remote|Hybrid|On-site|Zdalna|Hybrydowa)\\)?/i;
+    const MODE_STRIP_RE = /\\s*\\(?(Remote|Hybrid|On-site|Zdalna|Hybrydowa)\\)?\\s*/gi;
+    const CITY_COUNTRY_RE = /([A-ZÀ-Ž][a-zà-ž]+(?:,\\s*[A-ZÀ-Ž][a-zà-ž]+)+)/;
+    
+    // Whole-page text is only needed by fallbacks; read it at most once
+    let bodyTextCache = null;
+    function getBodyText() {
+        if (bodyTextCache === null) bodyTextCache = document.body.innerText;
+        return bodyTextCache;
+    }
+    
+    // Structured data (ld+json) is also fallback-only; parse it at most once
+    let ldCache;
+    function getLD() {
+        if (ldCache === undefined) {
+            ldCache = null;
+            const script = document.querySelector('script[type="application/ld+json"]');
+            if (script) {
+                try { ldCache = JSON.parse(script.textContent); } catch(e) {}
+            }
+        }
+        return ldCache;
+    }
+    
+    // --- Top card: title, company, location and work mode live here ---
+    // Scoping queries to it avoids walking LinkedIn's very large DOM per field
+    const root = document.querySelector('.top-card-layout, .jobs-unified-top-card, .job-details-jobs-unified-top-card__container--two-pane') || document;
     
     // --- 1. Title ---
-    const titleEl = document.querySelector('.jobs-unified-top-card__job-title') ||
-                   document.querySelector('h1.top-card-layout__title') ||
-                   document.querySelector('h1.t-24') ||
+    const titleEl = root.querySelector('.jobs-unified-top-card__job-title') ||
+                   root.querySelector('h1.top-card-layout__title') ||
+                   root.querySelector('h1.t-24') ||
+                   root.querySelector('h1') ||
                    document.querySelector('h1');
-    data.title = titleEl?.innerText?.trim() || '';
+    data.title = t(titleEl);
     
     // --- 2. Company ---
-    const companyEl = document.querySelector('.jobs-unified-top-card__company-name a') ||
-                     document.querySelector('.jobs-unified-top-card__company-name') ||
-                     document.querySelector('a.topcard__org-name-link') ||
-                     document.querySelector('.top-card-layout__first-subline a') ||
-                     document.querySelector('.job-details-jobs-unified-top-card__company-name');
+    const companyEl = root.querySelector('.jobs-unified-top-card__company-name a') ||
+                     root.querySelector('.jobs-unified-top-card__company-name') ||
+                     root.querySelector('a.topcard__org-name-link') ||
+                     root.querySelector('.top-card-layout__first-subline a') ||
+                     root.querySelector('.job-details-jobs-unified-top-card__company-name');
     
     if (companyEl) {
-        data.company = companyEl.innerText.trim();
+        data.company = t(companyEl);
     } else {
-         try {
-            const jsonLd = document.querySelector('script[type="application/ld+json"]');
-            if (jsonLd) {
-                const schema = JSON.parse(jsonLd.innerText);
-                if (schema['@type'] === 'JobPosting' && schema.hiringOrganization?.name) {
-                    data.company = schema.hiringOrganization.name;
-                }
-            }
-        } catch(e) {}
+        const schema = getLD();
+        if (schema?.['@type'] === 'JobPosting' && schema.hiringOrganization?.name) {
+            data.company = schema.hiringOrganization.name;
+        }
     }
 
     // --- 3. Location and Work Mode from top card ---
-    const topFlavors = document.querySelectorAll('.topcard__flavor--bullet, .topcard__flavor, .top-card-layout__first-subline span');
+    const topFlavors = root.querySelectorAll('.topcard__flavor--bullet, .topcard__flavor, .top-card-layout__first-subline span');
     for (const flavor of topFlavors) {
-        const txt = flavor.innerText?.trim() || '';
+        const txt = t(flavor);
         
         // Check for work mode in parentheses: "Poznań, Poland (Hybrid)"
-        const modeMatch = txt.match(/\\(?(Remote|Hybrid|On-site|Zdalna|Hybrydowa)\\)?/i);
+        const modeMatch = txt.match(MODE_RE);
         if (modeMatch) {
             data.workMode = modeMatch[1];
         }
@@ -342,16 +564,16 @@ LINKEDIN_EXTRACTION_SCRIPT = """
         // Location typically contains a comma (City, Country) and is not the company name
         if (!data.location && txt.includes(',') && txt.length > 2) {
             // This is likely a location like "Poznań, Poland"
-            data.location = txt.replace(/\\s*\\(?(Remote|Hybrid|On-site|Zdalna|Hybrydowa)\\)?\\s*/gi, '').trim();
+            data.location = txt.replace(MODE_STRIP_RE, '').trim();
         }
     }
     
     // Fallback location - look for specific location element
     if (!data.location) {
-        const locEl = document.querySelector('.jobs-unified-top-card__bullet') ||
-                      document.querySelector('.topcard__flavor--bullet');
+        const locEl = root.querySelector('.jobs-unified-top-card__bullet') ||
+                      root.querySelector('.topcard__flavor--bullet');
         if (locEl) {
-            const txt = locEl.innerText?.trim() || '';
+            const txt = t(locEl);
             // Only use if it looks like a location (has comma or Poland/Polska)
             if (txt.includes(',') || txt.toLowerCase().includes('poland') || txt.toLowerCase().includes('polska')) {
                 data.location = txt.replace(/\\s*\\(.*\\)\\s*$/, '');
@@ -361,11 +583,11 @@ LINKEDIN_EXTRACTION_SCRIPT = """
     
     // Last resort - try to find location in the subline
     if (!data.location) {
-        const subline = document.querySelector('.top-card-layout__first-subline, .topcard__flavor-row');
+        const subline = root.querySelector('.top-card-layout__first-subline, .topcard__flavor-row');
         if (subline) {
-            const txt = subline.innerText || '';
+            const txt = t(subline);
             // Look for patterns like "City, Country" or just city names
-            const locMatch = txt.match(/([A-ZÀ-Ž][a-zà-ž]+(?:,\\s*[A-ZÀ-Ž][a-zà-ž]+)+)/);
+            const locMatch = txt.match(CITY_COUNTRY_RE);
             if (locMatch) {
                 data.location = locMatch[1];
             }
@@ -374,11 +596,12 @@ LINKEDIN_EXTRACTION_SCRIPT = """
     
     // Fallback work mode
     if (!data.workMode) {
-        const workModeEl = document.querySelector('.jobs-unified-top-card__workplace-type');
+        const workModeEl = root.querySelector('.jobs-unified-top-card__workplace-type');
         if (workModeEl) {
-            data.workMode = workModeEl.innerText.trim();
+            data.workMode = t(workModeEl);
         } else {
             // Search in body text
+            const bodyText = getBodyText();
             if (bodyText.includes('Remote') || bodyText.includes('Zdalna')) data.workMode = 'Remote';
             else if (bodyText.includes('Hybrid') || bodyText.includes('Hybrydowa')) data.workMode = 'Hybrid';
         }
@@ -388,8 +611,8 @@ LINKEDIN_EXTRACTION_SCRIPT = """
     const criteriaItems = document.querySelectorAll('.description__job-criteria-item');
     criteriaItems.forEach(item => {
         // Fixed: use subtitle not subheader
-        const subtitle = item.querySelector('.description__job-criteria-subtitle')?.innerText?.toLowerCase() || '';
-        const text = item.querySelector('.description__job-criteria-text')?.innerText?.trim();
+        const subtitle = t(item.querySelector('.description__job-criteria-subtitle')).toLowerCase();
+        const text = t(item.querySelector('.description__job-criteria-text'));
         if (text) {
             if (subtitle.includes('seniority') || subtitle.includes('poziom')) {
                 data.experienceLevel = text;
@@ -405,9 +628,9 @@ LINKEDIN_EXTRACTION_SCRIPT = """
 
     // Fallback for seniority/employment from job insights
     if (!data.experienceLevel || !data.employmentType) {
-        const insights = document.querySelectorAll('.jobs-unified-top-card__job-insight, li');
+        const insights = root.querySelectorAll('.jobs-unified-top-card__job-insight, li');
         for (const insight of insights) {
-            const text = insight.innerText?.toLowerCase() || '';
+            const text = t(insight).toLowerCase();
             if (!data.employmentType) {
                 if (text.includes('full-time') || text.includes('pełny etat')) {
                     data.employmentType = 'Full-time';
@@ -442,6 +665,7 @@ LINKEDIN_EXTRACTION_SCRIPT = """
         d = d.replace(/\\n\\s*Show less\\s*$/i, '').trim();
         data.description = d;
     } else {
+         const bodyText = getBodyText();
          const startMarker = 'Full Job Description';
          const idx = bodyText.indexOf(startMarker);
          if (idx > -1) {
@@ -465,28 +689,39 @@ PRACUJ_EXTRACTION_SCRIPT = """
 (function() {
     const data = {};
     
+    // Index every [data-test] element in one traversal (first match wins,
+    // same as querySelector)
+    const byTest = new Map();
+    document.querySelectorAll('[data-test]').forEach(el => {
+        if (!byTest.has(el.dataset.test)) byTest.set(el.dataset.test, el);
+    });
+    
+    // Short text without forcing layout (innerText would); multi-line
+    // fields keep innerText for its line breaks
+    const t = el => el ? (el.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+    
     // Helper to get text from data-test
     function getTestText(testId) {
-        const el = document.querySelector(`[data-test="${testId}"]`);
-        return el ? el.innerText.trim() : null;
+        const el = byTest.get(testId);
+        return el ? t(el) : null;
     }
     
     // Helper to get badge title text from a sections-benefit element
     function getBadgeTitle(sectionTestId) {
-        const section = document.querySelector(`[data-test="${sectionTestId}"]`);
+        const section = byTest.get(sectionTestId);
         if (section) {
             const titleEl = section.querySelector('[data-test="offer-badge-title"]');
-            return titleEl ? titleEl.innerText.trim() : null;
+            return titleEl ? t(titleEl) : null;
         }
         return null;
     }
     
     // --- Title ---
-    data.title = getTestText('text-positionName') || document.querySelector('h1')?.innerText?.trim() || '';
+    data.title = getTestText('text-positionName') || t(document.querySelector('h1'));
     
     // --- Company (clean up "O firmie" / "About the company" suffix) ---
     let company = getTestText('text-employerName') || 
-                  document.querySelector('[data-test="anchor-company-profile"]')?.innerText.trim();
+                  t(byTest.get('anchor-company-profile'));
     if (company) {
         company = company.replace(/O firmie$/i, '').replace(/About the company$/i, '').trim();
     }
@@ -494,20 +729,20 @@ PRACUJ_EXTRACTION_SCRIPT = """
     
     // --- Salary ---
     // The salary section uses data-test="section-salary" and each amount is in data-test="text-earningAmount"
-    const salarySection = document.querySelector('[data-test="section-salary"]');
+    const salarySection = byTest.get('section-salary');
     if (salarySection) {
         // Get all earning amounts (there may be multiple for different contract types)
         const earningAmounts = salarySection.querySelectorAll('[data-test="text-earningAmount"]');
         if (earningAmounts.length > 0) {
             const salaries = [];
             earningAmounts.forEach(el => {
-                const amount = el.innerText.trim();
+                const amount = t(el);
                 // Get the contract type following this amount
                 const parent = el.closest('[data-test="section-salaryPerContractType"]');
                 if (parent) {
                     const contractType = parent.querySelector('[data-test="text-contractTypeName"]');
                     if (contractType) {
-                        salaries.push(amount + ' ' + contractType.innerText.trim());
+                        salaries.push(amount + ' ' + t(contractType));
                     } else {
                         salaries.push(amount);
                     }
@@ -528,14 +763,14 @@ PRACUJ_EXTRACTION_SCRIPT = """
     data.location = getBadgeTitle('sections-benefit-workplaces');
     if (!data.location) {
         // Try the map section with full address
-        const streetEl = document.querySelector('[data-test="text-address-street"]');
-        const addressEl = document.querySelector('[data-test="text-address"]');
+        const streetEl = byTest.get('text-address-street');
+        const addressEl = byTest.get('text-address');
         if (streetEl && addressEl) {
-            data.location = streetEl.innerText.trim() + ', ' + addressEl.innerText.trim();
+            data.location = t(streetEl) + ', ' + t(addressEl);
         } else if (addressEl) {
-            data.location = addressEl.innerText.trim();
+            data.location = t(addressEl);
         } else if (streetEl) {
-            data.location = streetEl.innerText.trim();
+            data.location = t(streetEl);
         }
     }
     // Clean up location - remove region suffix in parentheses like "(Masovian)"
@@ -566,7 +801,7 @@ PRACUJ_EXTRACTION_SCRIPT = """
     if (workModeEl) {
         const titleEl = workModeEl.querySelector('[data-test="offer-badge-title"]');
         if (titleEl) {
-            data.workMode = titleEl.innerText.trim();
+            data.workMode = t(titleEl);
         }
     }
     
@@ -575,16 +810,16 @@ PRACUJ_EXTRACTION_SCRIPT = """
         data.location = getTestText('text-workplaceAddress');
     }
     if (!data.workMode) {
-        const modeEl = document.querySelector('[data-test="text-workModes"]');
-        if (modeEl) data.workMode = modeEl.innerText.trim();
+        const modeEl = byTest.get('text-workModes');
+        if (modeEl) data.workMode = t(modeEl);
     }
     if (!data.experienceLevel) {
-        const expEl = document.querySelector('[data-test="text-experienceLevel"]');
-        if (expEl) data.experienceLevel = expEl.innerText.trim();
+        const expEl = byTest.get('text-experienceLevel');
+        if (expEl) data.experienceLevel = t(expEl);
     }
     if (!data.employmentType) {
-        const typeEl = document.querySelector('[data-test="text-contractType"]');
-        if (typeEl) data.employmentType = typeEl.innerText.trim();
+        const typeEl = byTest.get('text-contractType');
+        if (typeEl) data.employmentType = t(typeEl);
     }
     
     // --- Description (new structure uses multiple section-* elements) ---
@@ -601,18 +836,21 @@ PRACUJ_EXTRACTION_SCRIPT = """
     
     const descParts = [];
     descSections.forEach(sectionId => {
-        const sec = document.querySelector(`[data-test="${sectionId}"]`);
-        if (sec && sec.innerText && sec.innerText.trim().length > 10) {
-            descParts.push(sec.innerText.trim());
+        const sec = byTest.get(sectionId);
+        const text = sec?.innerText?.trim() || '';
+        if (text.length > 10) {
+            descParts.push(text);
         }
     });
     
     // Fallback: try generic section selector
     if (descParts.length === 0) {
         const genericSections = document.querySelectorAll('[data-test*="section-"]');
+        const seen = new Set();
         genericSections.forEach(sec => {
             const text = sec.innerText?.trim() || '';
-            if (text.length > 20 && !descParts.includes(text)) {
+            if (text.length > 20 && !seen.has(text)) {
+                seen.add(text);
                 descParts.push(text);
             }
         });
@@ -633,12 +871,11 @@ PRACUJ_EXTRACTION_SCRIPT = """
 """
 
 
+@lru_cache(maxsize=1024)
 def _detect_source(url: str) -> str:
     """Detect the job site source from URL."""
-    for source, pattern in URL_PATTERNS.items():
-        if re.search(pattern, url, re.IGNORECASE):
-            return source
-    return "unknown"
+    m = _SITE_RE.search(url)
+    return m.lastgroup if m else "unknown"
 
 
 def _get_extraction_script(source: str) -> str:
@@ -652,22 +889,16 @@ def _get_extraction_script(source: str) -> str:
     return scripts.get(source, "")
 
 
+@lru_cache(maxsize=1024)
 def _clean_linkedin_url(url: str) -> str:
     """Extract valid job URL from LinkedIn, processing collection links if needed."""
-    try:
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-        if 'currentJobId' in params:
-            job_id = params['currentJobId'][0]
-            return f"https://www.linkedin.com/jobs/view/{job_id}"
-    except:
-        pass
-        
-    if "/jobs/view/" in url:
-        parts = url.split("/jobs/view/")
-        if len(parts) > 1:
-            job_id = parts[1].split("?")[0].split("/")[0]
-            return f"https://www.linkedin.com/jobs/view/{job_id}"
+    m = _LINKEDIN_CURRENT_JOB_RE.search(url)
+    if m:
+        return f"https://www.linkedin.com/jobs/view/{unquote_plus(m.group(1))}"
+    
+    m = _LINKEDIN_JOB_ID_RE.search(url)
+    if m:
+        return f"https://www.linkedin.com/jobs/view/{m.group(1)}"
     return url
 
 
@@ -706,43 +937,189 @@ def _create_success_response(
     }
 
 
-async def _handle_cookies(page, source: str) -> None:
-    """Handle cookie consent popups based on site."""
+async def _block_resources(route) -> None:
+    """Route handler aborting requests for resources extraction doesn't need."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _TRACKER_RE.match(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _run_prep_script(page, source: str) -> None:
+    """Run the source's DOM preparation (cookie accept, section expansion) in one call."""
+    script = _PREP_SCRIPTS.get(source)
+    if not script:
+        return
     try:
-        if source == "justjoin":
-            btn = await page.query_selector("button:has-text('Accept'), button:has-text('Akceptuj')")
-            if btn:
-                await btn.click()
-                await asyncio.sleep(0.5)
-        elif source == "theprotocol":
-            btn = await page.query_selector("#onetrust-accept-btn-handler, button[id*='accept']")
-            if btn:
-                await btn.click()
-                await asyncio.sleep(0.5)
-    except:
+        await page.evaluate(script)
+    except Exception:
         pass
 
 
-async def _expand_sections(page, source: str) -> None:
-    """Expand 'show more' sections based on site."""
+async def _apply_page_style(page, source: str) -> None:
+    """Inject the source's stylesheet, if any, in one style recalc."""
+    style = _PAGE_STYLES.get(source)
+    if not style:
+        return
     try:
-        if source == "theprotocol":
-            await page.evaluate("""
-            const btns = document.querySelectorAll('button[data-test="button-toggle"], button');
-            btns.forEach(b => {
-                if(b.innerText.toLowerCase().includes('więcej') || b.innerText.toLowerCase().includes('more')) {
-                    b.click();
-                }
-            });
-            """)
-        elif source == "linkedin":
-            btn = await page.query_selector("button[aria-label*='more'], .jobs-description__footer-button, button.show-more-less-html__button--more")
-            if btn:
-                await btn.scroll_into_view_if_needed()
-                await btn.click()
-                await asyncio.sleep(0.5)
-    except:
+        await page.add_style_tag(content=style)
+    except Exception:
+        # Stylesheet refused (e.g. by a strict CSP); remove the overlays instead
+        try:
+            await page.evaluate(_PAGE_STYLE_FALLBACK_SCRIPTS[source])
+        except Exception:
+            pass
+
+
+async def _wait_until_ready(page, source: str) -> None:
+    """Wait for the offer title to render instead of sleeping a fixed time."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    try:
+        await page.wait_for_selector(_READY_SELECTORS[source], timeout=READY_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        # Let the extraction script report whatever did render
+        pass
+
+
+async def _reset_page_state(page, context) -> None:
+    """Close the page and wipe cookies/storage so the next offer starts clean."""
+    timeout = RESET_TIMEOUT_MS / 1000
+    try:
+        await asyncio.wait_for(page.evaluate(_CLEAR_STORAGE_SCRIPT), timeout=timeout)
+    except Exception:
         pass
+    # A page or context that can't be closed in time fails the scrape,
+    # so the pool recycles its browser
+    await asyncio.wait_for(page.close(), timeout=timeout)
+    await asyncio.wait_for(context.clear_cookies(), timeout=timeout)
+
+
+async def _prepare_page(page, url: str, source: str) -> None:
+    """Navigate and get the page ready for extraction."""
+    # Navigate with timeout
+    await page.goto(url, timeout=PAGE_TIMEOUT_MS, wait_until="domcontentloaded")
+    
+    # Wait for content to render
+    await _wait_until_ready(page, source)
+    
+    # Hide overlays before anything is clicked or read
+    await _apply_page_style(page, source)
+    
+    # Accept cookies / expand sections in-page in one roundtrip
+    await _run_prep_script(page, source)
+
+
+async def _scrape_with_browser(
+    pool: BrowserPool,
+    browser,
+    url: str,
+    initial_url: str,
+    source: str,
+    extraction_script: str,
+) -> Dict[str, Any]:
+    """
+    Scrape one already-validated URL on a browser borrowed from `pool`.
+    
+    Caller is responsible for the semaphore and the pool slot. Browser-level
+    failures propagate so the pool can recycle the instance.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    # Shared per-site context; state is wiped after each offer
+    context = await pool.get_context(browser, source)
+    page = await context.new_page()
+    
+    try:
+        # Skip images, media and fonts
+        await page.route("**/*", _block_resources)
+        
+        # Load the page, but never hold the slot past the cap
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SCRAPE_TIMEOUT_MS / 1000
+        timed_out = False
+        try:
+            await asyncio.wait_for(
+                _prepare_page(page, url, source), timeout=SCRAPE_TIMEOUT_MS / 1000
+            )
+        except (asyncio.TimeoutError, PlaywrightTimeoutError):
+            timed_out = True
+        
+        # Execute site-specific extraction script on whatever has rendered,
+        # within what is left of the cap
+        remaining = max(deadline - loop.time(), EXTRACTION_GRACE_MS / 1000)
+        try:
+            data = await asyncio.wait_for(page.evaluate(extraction_script), timeout=remaining)
+        except asyncio.TimeoutError:
+            timed_out = True
+            data = None
+        except Exception:
+            # A page cut off mid-navigation may have no document to read
+            if not timed_out:
+                raise
+            data = None
+        
+        if data and isinstance(data, dict) and (data.get("title") or not timed_out):
+            return _create_success_response(
+                url=url,
+                initial_url=initial_url,
+                source=source,
+                data=data,
+            )
+        elif timed_out:
+            return _create_error_response(
+                url=url,
+                initial_url=initial_url,
+                error_msg=f"Timeout: Page took longer than {SCRAPE_TIMEOUT_MS // 1000}s to load",
+            )
+        else:
+            return _create_error_response(
+                url=url,
+                initial_url=initial_url,
+                error_msg="Extraction script returned invalid data",
+            )
+        
+    finally:
+        await _reset_page_state(page, context)
+
+
+async def on_low_memory() -> None:
+    """
+    Release memory held between scrapes in the running event loop.
+    
+    Closes idle pooled browsers (busy ones finish their scrape first) and
+    clears the per-URL caches. Scraping keeps working afterwards; browsers
+    are relaunched on demand. Call it from a memory-pressure signal, e.g.
+    loop.add_signal_handler(signal.SIGUSR1, lambda: asyncio.ensure_future(on_low_memory())).
+    """
+    pool = _browser_pool.get(asyncio.get_running_loop())
+    if pool is not None:
+        await pool.drain_idle()
+    _detect_source.cache_clear()
+    _clean_linkedin_url.cache_clear()
+
+
+def _is_routine_error(exc: BaseException) -> bool:
+    """Whether a scrape failure is an expected network/browser error, not a bug."""
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    # Only loaded once a browser has been launched
+    playwright = sys.modules.get("playwright.async_api")
+    return playwright is not None and isinstance(exc, playwright.Error)
+
+
+async def shutdown_browsers() -> None:
+    """
+    Close the pooled browsers of the running event loop.
+    
+    Call before the loop ends (e.g. at the end of the coroutine passed to
+    asyncio.run) so Firefox processes don't outlive it. Later scrapes in
+    the same loop start a new pool.
+    """
+    pool = _browser_pool.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
 
 
 async def scrape_offer(url: str) -> Dict[str, Any]:
@@ -790,73 +1167,84 @@ async def scrape_offer(url: str) -> Dict[str, Any]:
             error_msg=f"No extraction script for source: {source}",
         )
     
-    # Acquire semaphore slot - this limits concurrent browsers
-    async with _get_semaphore():
+    # Acquire the site slot first so a task waiting on a busy site
+    # does not hold a browser slot another site could use
+    async with _get_site_semaphore(source), _get_semaphore():
         try:
-            # Launch fresh browser context for unique fingerprint
-            async with AsyncCamoufox(
-                headless=True,
-                humanize=True,
-                geoip=True,
-            ) as browser:
-                page = await browser.new_page()
-                
-                try:
-                    # Navigate with timeout
-                    await page.goto(url, timeout=PAGE_TIMEOUT_MS, wait_until="domcontentloaded")
-                    
-                    # Wait for content to load
-                    await asyncio.sleep(2)
-                    
-                    # Handle cookies
-                    await _handle_cookies(page, source)
-                    await asyncio.sleep(1)
-                    
-                    # Expand sections
-                    await _expand_sections(page, source)
-                    await asyncio.sleep(1)
-                    
-                    # Execute site-specific extraction script
-                    data = await page.evaluate(extraction_script)
-                    
-                    if data and isinstance(data, dict):
-                        return _create_success_response(
-                            url=url,
-                            initial_url=initial_url,
-                            source=source,
-                            data=data,
-                        )
-                    else:
-                        return _create_error_response(
-                            url=url,
-                            initial_url=initial_url,
-                            error_msg="Extraction script returned invalid data",
-                        )
-                    
-                except asyncio.TimeoutError:
-                    return _create_error_response(
-                        url=url,
-                        initial_url=initial_url,
-                        error_msg=f"Timeout: Page took longer than {PAGE_TIMEOUT_MS // 1000}s to load",
-                    )
-                finally:
-                    await page.close()
+            # One pool acquire covers navigation and extraction
+            pool = _get_pool()
+            async with pool.acquire() as browser:
+                return await _scrape_with_browser(
+                    pool, browser, url, initial_url, source, extraction_script
+                )
                     
         except Exception as e:
-            error_trace = traceback.format_exc()
+            if _is_routine_error(e):
+                # Network/browser failures: the message says it all
+                error_msg = f"Scraping failed: {str(e)}"
+            else:
+                error_trace = traceback.format_exc()
+                error_msg = f"Scraping failed: {str(e)}\n\nTraceback:\n{error_trace}"
             return _create_error_response(
                 url=url,
                 initial_url=initial_url,
-                error_msg=f"Scraping failed: {str(e)}\n\nTraceback:\n{error_trace}",
+                error_msg=error_msg,
             )
 
 
+async def _scrape_indexed(urls: List[str]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Run scrape_offer for every URL and yield (input index, result) pairs
+    as they complete.
+    
+    Every distinct URL gets its own task; repeated URLs share it and get
+    a copy of its result. The semaphores alone bound how many run at once,
+    and each task acquires its slot and pooled browser exactly once.
+    """
+    # One task per distinct URL string, fanned back out to every position
+    pending: Dict[asyncio.Future, List[int]] = {}
+    by_url: Dict[str, asyncio.Future] = {}
+    per_site: Dict[str, int] = {}
+    for i, url in enumerate(urls):
+        task = by_url.get(url) if isinstance(url, str) else None
+        if task is None:
+            task = asyncio.ensure_future(scrape_offer(url))
+            pending[task] = []
+            if isinstance(url, str):
+                by_url[url] = task
+                source = _detect_source(url)
+                if source != "unknown":
+                    per_site[source] = per_site.get(source, 0) + 1
+        pending[task].append(i)
+    
+    try:
+        # Launch, in parallel up front, only as many browsers as the
+        # per-site limits let the batch use at once
+        await _get_pool().warm(
+            sum(min(n, get_max_concurrent_per_site(site)) for site, n in per_site.items())
+        )
+        
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                indices = pending.pop(task)
+                result = task.result()
+                for n, index in enumerate(indices):
+                    yield index, result if n == 0 else dict(result)
+    finally:
+        # Cancel the siblings instead of leaving them running detached
+        for task in pending:
+            task.cancel()
+
+
 async def scrape_batch(urls: List[str]) -> List[Dict[str, Any]]:
     """
     Scrape multiple URLs concurrently.
     
-    This function uses asyncio.gather to process all URLs in parallel,
-    but the global semaphore ensures only 4 browsers run at once.
+    Every distinct URL gets its own task; repeated URLs are scraped once
+    and each of their positions gets its own copy of the result. The
+    browser semaphore (get_max_concurrent_browsers()) and the per-site
+    semaphores bound how many run at once.
     
     Args:
         urls: List of job offer URLs to scrape.
@@ -864,6 +1252,34 @@ async def scrape_batch(urls: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of result dicts, in the same order as input URLs.
     """
-    tasks = [scrape_offer(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=False)
-    return list(results)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+    batch = _scrape_indexed(urls)
+    try:
+        async for index, result in batch:
+            results[index] = result
+    finally:
+        await batch.aclose()
+    return results
+
+
+async def scrape_batch_iter(urls: List[str]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Scrape multiple URLs concurrently, yielding each result as it finishes.
+    
+    Same concurrency as scrape_batch, but results arrive in completion
+    order so callers can process them while the rest are still loading;
+    match them to inputs via 'initial_url'. Closing the iterator early
+    cancels the scrapes still running.
+    
+    Args:
+        urls: List of job offer URLs to scrape.
+        
+    Yields:
+        Result dicts, in completion order.
+    """
+    batch = _scrape_indexed(urls)
+    try:
+        async for _, result in batch:
+            yield result
+    finally:
+        await batch.aclose()
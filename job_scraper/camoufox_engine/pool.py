@@ -0,0 +1,240 @@
+"""
+Browser pool for the V2 engine.
+
+Keeps a bounded set of long-lived AsyncCamoufox browsers so that batch
+scraping pays the Firefox startup cost once per instance instead of once
+per URL. Each browser keeps one BrowserContext per site; core.py clears
+cookies and storage after every offer, and the context is rebuilt after
+MAX_USES_PER_CONTEXT scrapes to bound JS heap growth.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple
+
+from ..config import SCRAPING_CONFIG
+
+if TYPE_CHECKING:
+    from camoufox.async_api import AsyncCamoufox
+
+# Scrapes served by one browser before it is closed and relaunched (from config)
+MAX_USES_PER_INSTANCE = SCRAPING_CONFIG["max_uses_per_browser"]
+
+# Scrapes served by one per-site context before it is rebuilt (from config)
+MAX_USES_PER_CONTEXT = SCRAPING_CONFIG["max_uses_per_context"]
+
+# Launch options shared by every pooled browser
+BROWSER_OPTIONS = {
+    "headless": True,
+}
+
+# In-memory network cache per browser, in KB; blocked resources keep it small
+MEMORY_CACHE_KB = 16 * 1024
+
+
+def _memory_prefs(pool_size: int) -> Dict[str, Any]:
+    """Firefox prefs bounding per-browser memory, from the configured budget."""
+    budget_mb = SCRAPING_CONFIG["browser_memory_budget_mb"]
+    if not budget_mb:
+        return {}
+    # Each browser gets an equal share; mem.max is in MB, the cache in KB
+    share_mb = max(1, budget_mb // pool_size)
+    return {
+        "javascript.options.mem.max": share_mb,
+        "browser.cache.memory.capacity": min(MEMORY_CACHE_KB, share_mb * 1024),
+    }
+
+
+def _launch_options(pool_size: int) -> Dict[str, Any]:
+    """AsyncCamoufox options for one launch, read from config at launch time."""
+    options: Dict[str, Any] = dict(BROWSER_OPTIONS, geoip=SCRAPING_CONFIG["geoip"])
+    prefs = _memory_prefs(pool_size)
+    if prefs:
+        options["firefox_user_prefs"] = prefs
+    return options
+
+
+class _PooledBrowser:
+    """A launched browser together with the context manager that owns it."""
+
+    __slots__ = ("manager", "browser", "uses_left")
+
+    def __init__(self, manager: "AsyncCamoufox", browser) -> None:
+        self.manager = manager
+        self.browser = browser
+        self.uses_left = MAX_USES_PER_INSTANCE
+
+
+class _PooledContext:
+    """A reusable browser context and its remaining use budget."""
+
+    __slots__ = ("context", "uses_left")
+
+    def __init__(self, context) -> None:
+        self.context = context
+        self.uses_left = MAX_USES_PER_CONTEXT
+
+
+async def _close_quietly(target) -> None:
+    """Close a context or browser, ignoring errors from a dead process."""
+    try:
+        await target.close()
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """
+    Bounded pool of reusable Camoufox browsers.
+
+    The queue starts with `size` empty slots (None). Taking an empty slot
+    launches a browser for it; retiring a browser puts the empty slot back,
+    so a replacement is launched by whoever needs it next.
+
+    Must be created and used inside a single running event loop.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self._queue: "asyncio.Queue[Optional[_PooledBrowser]]" = asyncio.Queue()
+        for _ in range(size):
+            self._queue.put_nowait(None)
+        self._contexts: Dict[Tuple[int, str], _PooledContext] = {}
+        self._closed = False
+
+    async def _launch(self) -> _PooledBrowser:
+        """Start a new Camoufox browser."""
+        # Imported on first launch so the pool can be built without Camoufox
+        from camoufox.async_api import AsyncCamoufox
+
+        manager = AsyncCamoufox(**_launch_options(self.size))
+        browser = await manager.__aenter__()
+        return _PooledBrowser(manager, browser)
+
+    async def _retire(self, entry: _PooledBrowser) -> None:
+        """Close a browser and forget its contexts."""
+        browser_id = id(entry.browser)
+        for key in [key for key in self._contexts if key[0] == browser_id]:
+            del self._contexts[key]
+        try:
+            await entry.manager.__aexit__(None, None, None)
+        except Exception:
+            pass
+
+    async def _get(self) -> _PooledBrowser:
+        """Take a live browser from the pool, launching one for an empty slot."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        entry = await self._queue.get()
+        if self._closed:
+            # Closed while waiting: hand the slot back so other waiters see it too
+            self._queue.put_nowait(None)
+            if entry is not None:
+                await self._retire(entry)
+            raise RuntimeError("Browser pool is closed")
+        if entry is None:
+            try:
+                entry = await self._launch()
+            except BaseException:
+                self._queue.put_nowait(None)
+                raise
+        return entry
+
+    async def warm(self, count: int) -> None:
+        """
+        Launch browsers for up to `count` empty slots in parallel.
+
+        Slots are otherwise filled lazily, one launch per acquire; warming
+        ahead of a batch overlaps the startup cost of several instances.
+        """
+        if self._closed:
+            return
+        idle = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+        empty = sum(1 for entry in idle if entry is None)
+        to_launch = min(count, empty)
+        for entry in idle:
+            if entry is not None:
+                self._queue.put_nowait(entry)
+        for _ in range(empty - to_launch):
+            self._queue.put_nowait(None)
+        if to_launch <= 0:
+            return
+        tasks = [asyncio.ensure_future(self._launch()) for _ in range(to_launch)]
+        try:
+            launched = await asyncio.gather(*tasks, return_exceptions=True)
+        except BaseException:
+            # Close whatever already started so no Firefox process is leaked
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+            for task in tasks:
+                if not task.cancelled() and task.exception() is None:
+                    await self._retire(task.result())
+                self._queue.put_nowait(None)
+            raise
+        for entry in launched:
+            # A failed launch leaves the slot empty for a lazy retry
+            self._queue.put_nowait(entry if isinstance(entry, _PooledBrowser) else None)
+
+    async def _release(self, entry: _PooledBrowser, ok: bool) -> None:
+        """Return a browser to the pool, or retire it and free its slot."""
+        entry.uses_left -= 1
+        if ok and not self._closed and entry.uses_left > 0 and entry.browser.is_connected():
+            self._queue.put_nowait(entry)
+            return
+        await self._retire(entry)
+        self._queue.put_nowait(None)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator:
+        """
+        Borrow a browser for the duration of the block.
+
+        The browser is recycled if the block raises or after
+        MAX_USES_PER_INSTANCE uses.
+        """
+        entry = await self._get()
+        ok = False
+        try:
+            yield entry.browser
+            ok = True
+        finally:
+            await self._release(entry, ok)
+
+    async def get_context(self, browser, site: str):
+        """
+        Get the shared context for `site` on a borrowed browser.
+
+        Only the holder of `browser` may call this, so a context is never
+        used by two scrapes at once.
+        """
+        key = (id(browser), site)
+        entry = self._contexts.get(key)
+        if entry is not None and entry.uses_left <= 0:
+            del self._contexts[key]
+            await _close_quietly(entry.context)
+            entry = None
+        if entry is None:
+            entry = _PooledContext(await browser.new_context())
+            self._contexts[key] = entry
+        entry.uses_left -= 1
+        return entry.context
+
+    async def drain_idle(self) -> None:
+        """Close idle browsers but keep their slots, so the pool stays usable."""
+        idle = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+        for _ in idle:
+            self._queue.put_nowait(None)
+        for entry in idle:
+            if entry is not None:
+                await self._retire(entry)
+
+    async def close(self) -> None:
+        """Close all idle browsers; busy ones are closed when released."""
+        self._closed = True
+        while not self._queue.empty():
+            entry = self._queue.get_nowait()
+            if entry is not None:
+                await self._retire(entry)
@@ -8,8 +8,42 @@ SCRAPING_CONFIG = {
     # Lower this on memory-constrained devices (e.g., Raspberry Pi)
     "max_concurrent_browsers": 3,
     
-    # Page load timeout in milliseconds
+    # Navigation timeout in milliseconds
+    # Navigation counts toward scrape_timeout_ms, so values above it have no effect
     "page_timeout_ms": 30000,
+    
+    # Wall-clock cap in milliseconds for loading, preparing and extracting one
+    # page (navigation, render wait, cookies, expanding, extraction); when it
+    # expires extraction still gets a short grace on whatever has rendered,
+    # so a slow host can't hold a browser slot
+    "scrape_timeout_ms": 20000,
+    
+    # How long to wait for the offer to render after navigation, in milliseconds
+    # Extraction still runs when it expires
+    "ready_timeout_ms": 8000,
+    
+    # Number of scrapes a pooled browser serves before it is relaunched
+    # Bounds memory growth of long-lived Firefox processes
+    "max_uses_per_browser": 20,
+    
+    # Number of same-site scrapes sharing one browser context before it is rebuilt
+    "max_uses_per_context": 10,
+    
+    # Match locale/timezone to the exit IP (costs an IP lookup per launch)
+    "geoip": True,
+    
+    # Total memory budget in MB shared by pooled browsers (None = no limit)
+    # Each browser's JS heap is capped at budget / pool size
+    "browser_memory_budget_mb": None,
+    
+    # Maximum concurrent scrapes per site, on top of the browser limit
+    # Keeps batches of same-site URLs under the sites' anti-bot thresholds
+    "max_concurrent_per_site": {
+        "justjoin": 3,
+        "theprotocol": 2,
+        "pracuj": 2,
+        "linkedin": 1,
+    },
 }
 
 
@@ -23,3 +57,16 @@ def set_max_concurrent_browsers(limit: int) -> None:
     if limit < 1:
         raise ValueError("Concurrency limit must be at least 1")
     SCRAPING_CONFIG["max_concurrent_browsers"] = limit
+
+
+def get_max_concurrent_per_site(source: str) -> int:
+    """Get the maximum number of concurrent scrapes for one site."""
+    limits = SCRAPING_CONFIG["max_concurrent_per_site"]
+    return limits.get(source, SCRAPING_CONFIG["max_concurrent_browsers"])
+
+
+def set_max_concurrent_per_site(source: str, limit: int) -> None:
+    """Set the maximum number of concurrent scrapes for one site."""
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1")
+    SCRAPING_CONFIG["max_concurrent_per_site"][source] = limit
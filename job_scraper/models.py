@@ -2,11 +2,15 @@
 Data models for job offers.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 import json
 
+# Fixed rules used by to_text()
+_TEXT_RULE = "=" * 60
+_TEXT_DIVIDER = "-" * 40
+
 
 @dataclass
 class JobOffer:
@@ -30,11 +34,42 @@ class JobOffer:
     # Metadata
     scraped_at: datetime = field(default_factory=datetime.now)
     
+    @classmethod
+    def from_response(cls, response: dict) -> "JobOffer":
+        """Build from a successful scrape_offer() result dict."""
+        if response.get("status") != "success":
+            raise ValueError("Only successful scrape results can become a JobOffer")
+        scraped_at = response.get("scraped_at")
+        return cls(
+            url=response["url"],
+            title=response.get("title") or "",
+            company=response.get("company") or "",
+            source=response["source"],
+            location=response.get("location"),
+            salary=response.get("salary"),
+            experience_level=response.get("experience_level"),
+            employment_type=response.get("employment_type"),
+            work_mode=response.get("work_mode"),
+            description=response.get("description") or "",
+            scraped_at=datetime.fromisoformat(scraped_at) if scraped_at else datetime.now(),
+        )
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data["scraped_at"] = self.scraped_at.isoformat()
-        return data
+        # Flat fields only, so skip asdict()'s recursive deep copy
+        return {
+            "url": self.url,
+            "title": self.title,
+            "company": self.company,
+            "source": self.source,
+            "location": self.location,
+            "salary": self.salary,
+            "experience_level": self.experience_level,
+            "employment_type": self.employment_type,
+            "work_mode": self.work_mode,
+            "description": self.description,
+            "scraped_at": self.scraped_at.isoformat(),
+        }
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
@@ -43,14 +78,14 @@ class JobOffer:
     def to_text(self) -> str:
         """Convert to human-readable text format."""
         lines = [
-            f"{'='*60}",
+            _TEXT_RULE,
             f"JOB OFFER: {self.title}",
-            f"{'='*60}",
-            f"",
+            _TEXT_RULE,
+            "",
             f"Company: {self.company}",
             f"Source: {self.source}",
             f"URL: {self.url}",
-            f"",
+            "",
         ]
         
         if self.location:
@@ -68,9 +103,9 @@ class JobOffer:
         
         if self.description:
             lines.append("📝 Description:")
-            lines.append("-" * 40)
+            lines.append(_TEXT_DIVIDER)
             lines.append(self.description)
-            lines.append("-" * 40)
+            lines.append(_TEXT_DIVIDER)
         
         lines.append("")
         lines.append(f"Scraped at: {self.scraped_at.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -0,0 +1,345 @@
+"""
+Unit tests for the V2 engine's pure-Python helpers and batch dispatch.
+
+No browser is launched; scrape_offer and the pool are stubbed where needed:
+    python -m unittest discover tests -p "test_engine.py"
+"""
+
+import asyncio
+import sys
+import types
+import unittest
+from unittest import mock
+
+from job_scraper import config
+from job_scraper.camoufox_engine import core
+from job_scraper.camoufox_engine.core import (
+    _TRACKER_RE,
+    _clean_linkedin_url,
+    _detect_source,
+    _is_routine_error,
+    scrape_batch,
+    scrape_batch_iter,
+    scrape_offer,
+)
+
+
+class DetectSourceTest(unittest.TestCase):
+    def test_known_sites(self) -> None:
+        self.assertEqual(_detect_source("https://justjoin.it/job-offer/x"), "justjoin")
+        self.assertEqual(_detect_source("https://theprotocol.it/szczegoly/praca/x"), "theprotocol")
+        self.assertEqual(_detect_source("https://www.pracuj.pl/praca/x,oferta,1"), "pracuj")
+        self.assertEqual(_detect_source("https://www.linkedin.com/jobs/view/1"), "linkedin")
+
+    def test_case_insensitive(self) -> None:
+        self.assertEqual(_detect_source("https://JustJoin.IT/job-offer/x"), "justjoin")
+
+    def test_unknown(self) -> None:
+        self.assertEqual(_detect_source("https://www.linkedin.com/in/someone"), "unknown")
+        self.assertEqual(_detect_source("https://example.com"), "unknown")
+
+
+class CleanLinkedinUrlTest(unittest.TestCase):
+    def test_view_url_drops_query(self) -> None:
+        self.assertEqual(
+            _clean_linkedin_url("https://www.linkedin.com/jobs/view/4350691274/?refId=abc"),
+            "https://www.linkedin.com/jobs/view/4350691274",
+        )
+
+    def test_collection_link_uses_current_job_id(self) -> None:
+        self.assertEqual(
+            _clean_linkedin_url(
+                "https://www.linkedin.com/jobs/collections/recommended/?currentJobId=42&x=1"
+            ),
+            "https://www.linkedin.com/jobs/view/42",
+        )
+
+    def test_current_job_id_takes_priority(self) -> None:
+        self.assertEqual(
+            _clean_linkedin_url("https://www.linkedin.com/jobs/view/1/?a=b&currentJobId=2"),
+            "https://www.linkedin.com/jobs/view/2",
+        )
+
+    def test_current_job_id_is_unquoted(self) -> None:
+        self.assertEqual(
+            _clean_linkedin_url("https://www.linkedin.com/jobs/search/?currentJobId=12%2034"),
+            "https://www.linkedin.com/jobs/view/12 34",
+        )
+
+    def test_current_job_id_in_fragment_is_ignored(self) -> None:
+        url = "https://www.linkedin.com/jobs/search/?keywords=x#currentJobId=9"
+        self.assertEqual(_clean_linkedin_url(url), url)
+
+    def test_other_urls_unchanged(self) -> None:
+        url = "https://www.linkedin.com/jobs/search/?keywords=python"
+        self.assertEqual(_clean_linkedin_url(url), url)
+
+
+class TrackerPatternTest(unittest.TestCase):
+    def test_blocks_tracker_hosts(self) -> None:
+        for url in (
+            "https://www.googletagmanager.com/gtm.js?id=1",
+            "https://doubleclick.net/",
+            "https://static.hotjar.com:443/c/hotjar.js",
+            "http://connect.facebook.net",
+        ):
+            self.assertTrue(_TRACKER_RE.match(url), url)
+
+    def test_allows_other_hosts(self) -> None:
+        for url in (
+            "https://notdoubleclick.net/a.js",
+            "https://hotjar.com.example.org/",
+            "https://justjoin.it/?ref=googletagmanager.com",
+            "https://cdn.example.com/google-analytics.com.js",
+        ):
+            self.assertIsNone(_TRACKER_RE.match(url), url)
+
+
+class RoutineErrorTest(unittest.TestCase):
+    def test_network_errors_are_routine(self) -> None:
+        self.assertTrue(_is_routine_error(asyncio.TimeoutError()))
+        self.assertTrue(_is_routine_error(ConnectionResetError()))
+
+    def test_bugs_are_not_routine(self) -> None:
+        self.assertFalse(_is_routine_error(KeyError("title")))
+
+    def test_playwright_errors_are_routine_once_loaded(self) -> None:
+        stub = types.ModuleType("playwright.async_api")
+        stub.Error = type("Error", (Exception,), {})
+        with mock.patch.dict(sys.modules, {"playwright.async_api": stub}):
+            self.assertTrue(_is_routine_error(stub.Error("Target closed")))
+            self.assertFalse(_is_routine_error(ValueError()))
+
+
+class PerSiteConfigTest(unittest.TestCase):
+    def setUp(self) -> None:
+        limits = dict(config.SCRAPING_CONFIG["max_concurrent_per_site"])
+        self.addCleanup(config.SCRAPING_CONFIG.__setitem__, "max_concurrent_per_site", limits)
+
+    def test_known_site(self) -> None:
+        self.assertEqual(config.get_max_concurrent_per_site("linkedin"), 1)
+
+    def test_unknown_site_falls_back_to_browser_limit(self) -> None:
+        self.assertEqual(
+            config.get_max_concurrent_per_site("elsewhere"),
+            config.get_max_concurrent_browsers(),
+        )
+
+    def test_set_limit(self) -> None:
+        config.set_max_concurrent_per_site("pracuj", 4)
+        self.assertEqual(config.get_max_concurrent_per_site("pracuj"), 4)
+
+    def test_rejects_limit_below_one(self) -> None:
+        with self.assertRaises(ValueError):
+            config.set_max_concurrent_per_site("pracuj", 0)
+
+
+class ScrapeOfferValidationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_rejects_empty_url(self) -> None:
+        result = await scrape_offer("")
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Invalid URL", result["error_description"])
+
+    async def test_rejects_unsupported_url(self) -> None:
+        result = await scrape_offer(" https://example.com/job ")
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["initial_url"], " https://example.com/job ")
+        self.assertEqual(result["url"], "https://example.com/job")
+
+
+class PageStyleTest(unittest.IsolatedAsyncioTestCase):
+    async def test_style_injected(self) -> None:
+        page = mock.Mock()
+        page.add_style_tag = mock.AsyncMock()
+        page.evaluate = mock.AsyncMock()
+        await core._apply_page_style(page, "linkedin")
+        page.add_style_tag.assert_awaited_once()
+        page.evaluate.assert_not_awaited()
+
+    async def test_refused_style_falls_back_to_removing_overlays(self) -> None:
+        page = mock.Mock()
+        page.add_style_tag = mock.AsyncMock(side_effect=RuntimeError("blocked by CSP"))
+        page.evaluate = mock.AsyncMock()
+        await core._apply_page_style(page, "linkedin")
+        page.evaluate.assert_awaited_once_with(core._PAGE_STYLE_FALLBACK_SCRIPTS["linkedin"])
+
+    async def test_sources_without_style_are_untouched(self) -> None:
+        page = mock.Mock()
+        page.add_style_tag = mock.AsyncMock()
+        await core._apply_page_style(page, "pracuj")
+        page.add_style_tag.assert_not_awaited()
+
+
+class HangingPage:
+    """Page whose every call blocks until cancelled."""
+
+    async def evaluate(self, script):
+        await asyncio.sleep(3600)
+
+    async def add_style_tag(self, content):
+        await asyncio.sleep(3600)
+
+
+class PagePrepCancellationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_timeout_propagates_through_prep_helpers(self) -> None:
+        for helper, source in ((core._run_prep_script, "justjoin"), (core._apply_page_style, "linkedin")):
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(helper(HangingPage(), source), timeout=0.01)
+
+    async def test_cancel_propagates_through_prep_script(self) -> None:
+        task = asyncio.ensure_future(core._run_prep_script(HangingPage(), "theprotocol"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_page_errors_are_ignored(self) -> None:
+        page = mock.Mock()
+        page.evaluate = mock.AsyncMock(side_effect=RuntimeError("detached"))
+        await core._run_prep_script(page, "linkedin")
+
+
+class ScriptedPage:
+    """Page whose named steps either finish at once or block until cancelled."""
+
+    def __init__(self, hang=(), data=None) -> None:
+        self.hang = set(hang)
+        self.data = data
+
+    async def _step(self, name: str) -> None:
+        if name in self.hang:
+            await asyncio.sleep(3600)
+
+    async def route(self, pattern, handler) -> None:
+        pass
+
+    async def goto(self, url, **kwargs) -> None:
+        await self._step("goto")
+
+    async def wait_for_selector(self, selector, **kwargs) -> None:
+        pass
+
+    async def evaluate(self, script):
+        if script == core._CLEAR_STORAGE_SCRIPT:
+            return await self._step("clear")
+        await self._step("extract")
+        return self.data
+
+    async def close(self) -> None:
+        await self._step("close")
+
+
+class ScrapeTimeoutTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        stub = types.ModuleType("playwright.async_api")
+        stub.TimeoutError = type("TimeoutError", (Exception,), {})
+        for patcher in (
+            mock.patch.dict(sys.modules, {"playwright.async_api": stub}),
+            mock.patch.multiple(
+                core, SCRAPE_TIMEOUT_MS=50, EXTRACTION_GRACE_MS=50, RESET_TIMEOUT_MS=50
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def scrape(self, page: ScriptedPage):
+        context = mock.Mock()
+        context.new_page = mock.AsyncMock(return_value=page)
+        context.clear_cookies = mock.AsyncMock()
+        pool = mock.Mock()
+        pool.get_context = mock.AsyncMock(return_value=context)
+        url = "https://www.pracuj.pl/praca/x,oferta,1"
+        return await asyncio.wait_for(
+            core._scrape_with_browser(pool, None, url, url, "pracuj", "extract"), timeout=1
+        )
+
+    async def test_extracts_what_rendered_after_prep_timeout(self) -> None:
+        result = await self.scrape(ScriptedPage(hang={"goto"}, data={"title": "Dev"}))
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["title"], "Dev")
+
+    async def test_hanging_extraction_after_prep_timeout(self) -> None:
+        result = await self.scrape(ScriptedPage(hang={"goto", "extract"}))
+        self.assertEqual(result["status"], "error")
+        self.assertIn("Timeout", result["error_description"])
+
+    async def test_hanging_extraction_is_bounded(self) -> None:
+        result = await self.scrape(ScriptedPage(hang={"extract"}))
+        self.assertIn("Timeout", result["error_description"])
+
+    async def test_hanging_storage_clear_is_skipped(self) -> None:
+        result = await self.scrape(ScriptedPage(hang={"clear"}, data={"title": "Dev"}))
+        self.assertEqual(result["status"], "success")
+
+    async def test_hanging_page_close_fails_the_scrape(self) -> None:
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scrape(ScriptedPage(hang={"close"}, data={"title": "Dev"}))
+
+
+class FakePool:
+    """Records warm() calls instead of launching browsers."""
+
+    def __init__(self) -> None:
+        self.warmed = []
+
+    async def warm(self, count: int) -> None:
+        self.warmed.append(count)
+
+
+class ScrapeBatchTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.calls = []
+        self.pool = FakePool()
+
+        async def fake_scrape_offer(url):
+            self.calls.append(url)
+            # Finish in reverse input order to exercise reordering
+            await asyncio.sleep(0.01 * (10 - len(self.calls)))
+            return {"status": "success", "initial_url": url}
+
+        for name, value in (("scrape_offer", fake_scrape_offer), ("_get_pool", lambda: self.pool)):
+            patcher = mock.patch.object(core, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_batch_keeps_input_order(self) -> None:
+        urls = [f"https://justjoin.it/job-offer/{i}" for i in range(3)]
+        results = await scrape_batch(urls)
+        self.assertEqual([r["initial_url"] for r in results], urls)
+
+    async def test_iter_yields_in_completion_order(self) -> None:
+        urls = [f"https://justjoin.it/job-offer/{i}" for i in range(3)]
+        results = [r["initial_url"] async for r in scrape_batch_iter(urls)]
+        self.assertEqual(results, urls[::-1])
+
+    async def test_repeated_urls_scraped_once_in_input_order(self) -> None:
+        a = "https://justjoin.it/job-offer/a"
+        b = "https://www.pracuj.pl/praca/b,oferta,1"
+        results = await scrape_batch([a, b, a, a])
+        self.assertEqual(sorted(self.calls), sorted([a, b]))
+        self.assertEqual([r["initial_url"] for r in results], [a, b, a, a])
+
+    async def test_repeated_urls_get_independent_copies(self) -> None:
+        url = "https://justjoin.it/job-offer/a"
+        results = await scrape_batch([url, url])
+        self.assertEqual(results[0], results[1])
+        self.assertIsNot(results[0], results[1])
+        results[1]["status"] = "changed"
+        self.assertEqual(results[0]["status"], "success")
+
+    async def test_whitespace_variants_are_distinct(self) -> None:
+        url = "https://justjoin.it/job-offer/a"
+        results = await scrape_batch([url, f" {url}"])
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual([r["initial_url"] for r in results], [url, f" {url}"])
+
+    async def test_warm_respects_per_site_limits(self) -> None:
+        linkedin = [f"https://www.linkedin.com/jobs/view/{i}" for i in range(6)]
+        justjoin = ["https://justjoin.it/job-offer/a"] * 2
+        await scrape_batch(linkedin + justjoin + ["https://example.com"])
+        # LinkedIn is capped at 1; the repeated JustJoin URL counts once
+        self.assertEqual(self.pool.warmed, [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the JobOffer model.
+"""
+
+import json
+import unittest
+from dataclasses import fields
+from datetime import datetime
+
+from job_scraper.models import JobOffer
+
+SUCCESS_RESPONSE = {
+    "status": "success",
+    "initial_url": " https://justjoin.it/job-offer/x ",
+    "url": "https://justjoin.it/job-offer/x",
+    "title": "Data Engineer",
+    "company": "ACME",
+    "source": "justjoin",
+    "location": "Warszawa",
+    "salary": "20 000 - 25 000 PLN",
+    "experience_level": "Mid",
+    "employment_type": "B2B",
+    "work_mode": "Hybrid",
+    "description": "Build pipelines.",
+    "scraped_at": "2026-01-02T03:04:05",
+}
+
+
+class FromResponseTest(unittest.TestCase):
+    def test_maps_success_response(self) -> None:
+        offer = JobOffer.from_response(SUCCESS_RESPONSE)
+        self.assertEqual(offer.url, "https://justjoin.it/job-offer/x")
+        self.assertEqual(offer.title, "Data Engineer")
+        self.assertEqual(offer.work_mode, "Hybrid")
+        self.assertEqual(offer.scraped_at, datetime(2026, 1, 2, 3, 4, 5))
+
+    def test_missing_optional_fields(self) -> None:
+        response = {"status": "success", "url": "u", "source": "linkedin", "title": None}
+        offer = JobOffer.from_response(response)
+        self.assertEqual(offer.title, "")
+        self.assertIsNone(offer.salary)
+        self.assertEqual(offer.description, "")
+
+    def test_rejects_error_response(self) -> None:
+        with self.assertRaises(ValueError):
+            JobOffer.from_response({"status": "error", "url": "u"})
+
+
+class ToDictTest(unittest.TestCase):
+    def test_has_every_field_in_order(self) -> None:
+        offer = JobOffer.from_response(SUCCESS_RESPONSE)
+        self.assertEqual(list(offer.to_dict()), [f.name for f in fields(JobOffer)])
+
+    def test_round_trips_response_fields(self) -> None:
+        data = JobOffer.from_response(SUCCESS_RESPONSE).to_dict()
+        for key, value in data.items():
+            self.assertEqual(value, SUCCESS_RESPONSE[key], key)
+
+    def test_to_json(self) -> None:
+        offer = JobOffer(url="u", title="Łódź", company="c", source="pracuj")
+        text = offer.to_json()
+        self.assertIn("Łódź", text)
+        self.assertEqual(json.loads(text)["scraped_at"], offer.scraped_at.isoformat())
+
+
+if __name__ == "__main__":
+    unittest.main()
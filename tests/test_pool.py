@@ -0,0 +1,275 @@
+"""
+Unit tests for the V2 browser pool.
+
+Camoufox is replaced by an in-memory stub, so these run without a browser:
+    python -m unittest discover tests -p "test_pool.py"
+"""
+
+import asyncio
+import sys
+import types
+import unittest
+from unittest import mock
+
+from job_scraper.camoufox_engine import pool as pool_module
+from job_scraper.camoufox_engine.pool import BrowserPool, _memory_prefs
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self) -> FakeContext:
+        return FakeContext()
+
+
+class FakeCamoufox:
+    """Stand-in for AsyncCamoufox; behaviour is driven by class-level knobs."""
+
+    instances = []
+    failures = 0
+    delays = []
+
+    def __init__(self, **options) -> None:
+        self.options = options
+        self.browser = None
+        self.closed = False
+
+    async def __aenter__(self) -> FakeBrowser:
+        delay = FakeCamoufox.delays.pop(0) if FakeCamoufox.delays else 0
+        if delay:
+            await asyncio.sleep(delay)
+        if FakeCamoufox.failures:
+            FakeCamoufox.failures -= 1
+            raise RuntimeError("launch failed")
+        self.browser = FakeBrowser()
+        FakeCamoufox.instances.append(self)
+        return self.browser
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.closed = True
+
+
+def _slots(pool: BrowserPool) -> list:
+    """Snapshot of the pool queue without taking anything out."""
+    return list(pool._queue._queue)
+
+
+class BrowserPoolTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        FakeCamoufox.instances = []
+        FakeCamoufox.failures = 0
+        FakeCamoufox.delays = []
+        stub = types.ModuleType("camoufox.async_api")
+        stub.AsyncCamoufox = FakeCamoufox
+        patcher = mock.patch.dict(
+            sys.modules, {"camoufox": types.ModuleType("camoufox"), "camoufox.async_api": stub}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertSlotsConserved(self, pool: BrowserPool) -> None:
+        self.assertEqual(len(_slots(pool)), pool.size)
+
+    async def test_rejects_empty_pool(self) -> None:
+        with self.assertRaises(ValueError):
+            BrowserPool(0)
+
+    async def test_launch_failure_keeps_slot(self) -> None:
+        pool = BrowserPool(2)
+        FakeCamoufox.failures = 1
+        with self.assertRaises(RuntimeError):
+            async with pool.acquire():
+                pass
+        self.assertEqual(_slots(pool), [None, None])
+        async with pool.acquire() as browser:
+            self.assertIsInstance(browser, FakeBrowser)
+        self.assertSlotsConserved(pool)
+
+    async def test_browser_reused_between_acquires(self) -> None:
+        pool = BrowserPool(1)
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(len(FakeCamoufox.instances), 1)
+
+    async def test_error_in_block_recycles_browser(self) -> None:
+        pool = BrowserPool(2)
+        with self.assertRaises(ValueError):
+            async with pool.acquire():
+                raise ValueError("scrape failed")
+        self.assertTrue(FakeCamoufox.instances[0].closed)
+        self.assertEqual(_slots(pool), [None, None])
+        async with pool.acquire():
+            pass
+        self.assertEqual(len(FakeCamoufox.instances), 2)
+
+    async def test_browser_recycled_after_max_uses(self) -> None:
+        with mock.patch.object(pool_module, "MAX_USES_PER_INSTANCE", 2):
+            pool = BrowserPool(1)
+            for _ in range(3):
+                async with pool.acquire():
+                    pass
+        self.assertEqual(len(FakeCamoufox.instances), 2)
+        self.assertTrue(FakeCamoufox.instances[0].closed)
+        self.assertFalse(FakeCamoufox.instances[1].closed)
+        self.assertSlotsConserved(pool)
+
+    async def test_disconnected_browser_is_retired(self) -> None:
+        pool = BrowserPool(1)
+        async with pool.acquire() as browser:
+            browser.connected = False
+        self.assertTrue(FakeCamoufox.instances[0].closed)
+        self.assertEqual(_slots(pool), [None])
+
+    async def test_warm_launches_only_empty_slots(self) -> None:
+        pool = BrowserPool(3)
+        await pool.warm(5)
+        self.assertEqual(len(FakeCamoufox.instances), 3)
+        await pool.warm(2)
+        self.assertEqual(len(FakeCamoufox.instances), 3)
+        self.assertNotIn(None, _slots(pool))
+
+    async def test_warm_partial_count(self) -> None:
+        pool = BrowserPool(3)
+        await pool.warm(1)
+        self.assertEqual(len(FakeCamoufox.instances), 1)
+        self.assertEqual(_slots(pool).count(None), 2)
+
+    async def test_warm_launch_failure_leaves_slot_empty(self) -> None:
+        pool = BrowserPool(3)
+        FakeCamoufox.failures = 1
+        await pool.warm(3)
+        self.assertEqual(len(FakeCamoufox.instances), 2)
+        self.assertEqual(_slots(pool).count(None), 1)
+        self.assertSlotsConserved(pool)
+
+    async def test_cancelled_warm_closes_launched_browsers(self) -> None:
+        pool = BrowserPool(3)
+        FakeCamoufox.delays = [0, 10, 10]
+        task = asyncio.ensure_future(pool.warm(3))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(len(FakeCamoufox.instances), 1)
+        self.assertTrue(FakeCamoufox.instances[0].closed)
+        self.assertEqual(_slots(pool), [None, None, None])
+
+    async def test_drain_idle_closes_idle_and_keeps_slots(self) -> None:
+        pool = BrowserPool(2)
+        await pool.warm(2)
+        await pool.drain_idle()
+        self.assertTrue(all(instance.closed for instance in FakeCamoufox.instances))
+        self.assertEqual(_slots(pool), [None, None])
+        async with pool.acquire():
+            pass
+        self.assertEqual(len(FakeCamoufox.instances), 3)
+
+    async def test_drain_idle_leaves_busy_browser(self) -> None:
+        pool = BrowserPool(2)
+        async with pool.acquire():
+            await pool.drain_idle()
+            self.assertFalse(FakeCamoufox.instances[0].closed)
+        self.assertSlotsConserved(pool)
+
+    async def test_close_retires_idle_and_released_browsers(self) -> None:
+        pool = BrowserPool(2)
+        async with pool.acquire():
+            pass
+        async with pool.acquire():
+            await pool.close()
+        self.assertEqual(len(FakeCamoufox.instances), 2)
+        self.assertTrue(all(instance.closed for instance in FakeCamoufox.instances))
+        with self.assertRaises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+    async def test_close_fails_waiting_acquire(self) -> None:
+        pool = BrowserPool(1)
+        async with pool.acquire():
+            waiter = asyncio.ensure_future(pool.acquire().__aenter__())
+            await asyncio.sleep(0)
+            await pool.close()
+        with self.assertRaises(RuntimeError):
+            await waiter
+        self.assertEqual(len(FakeCamoufox.instances), 1)
+        self.assertEqual(_slots(pool), [None])
+
+    async def test_context_shared_per_site(self) -> None:
+        pool = BrowserPool(1)
+        async with pool.acquire() as browser:
+            first = await pool.get_context(browser, "justjoin")
+            again = await pool.get_context(browser, "justjoin")
+            other = await pool.get_context(browser, "linkedin")
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+
+    async def test_context_rebuilt_after_max_uses(self) -> None:
+        with mock.patch.object(pool_module, "MAX_USES_PER_CONTEXT", 2):
+            pool = BrowserPool(1)
+            async with pool.acquire() as browser:
+                contexts = [await pool.get_context(browser, "pracuj") for _ in range(3)]
+        self.assertIs(contexts[0], contexts[1])
+        self.assertIsNot(contexts[1], contexts[2])
+        self.assertTrue(contexts[0].closed)
+
+    async def test_contexts_dropped_with_retired_browser(self) -> None:
+        pool = BrowserPool(1)
+        with self.assertRaises(ValueError):
+            async with pool.acquire() as browser:
+                await pool.get_context(browser, "justjoin")
+                raise ValueError("scrape failed")
+        self.assertEqual(pool._contexts, {})
+
+    async def test_memory_prefs_passed_at_launch(self) -> None:
+        with mock.patch.dict(pool_module.SCRAPING_CONFIG, {"browser_memory_budget_mb": 900}):
+            pool = BrowserPool(3)
+            async with pool.acquire():
+                pass
+        prefs = FakeCamoufox.instances[0].options["firefox_user_prefs"]
+        self.assertEqual(prefs["javascript.options.mem.max"], 300)
+
+    async def test_geoip_read_at_launch(self) -> None:
+        pool = BrowserPool(1)
+        with mock.patch.dict(pool_module.SCRAPING_CONFIG, {"geoip": False}):
+            async with pool.acquire():
+                pass
+        options = FakeCamoufox.instances[0].options
+        self.assertIs(options["geoip"], False)
+        self.assertNotIn("humanize", options)
+
+
+class MemoryPrefsTest(unittest.TestCase):
+    def test_no_budget_means_no_prefs(self) -> None:
+        with mock.patch.dict(pool_module.SCRAPING_CONFIG, {"browser_memory_budget_mb": None}):
+            self.assertEqual(_memory_prefs(3), {})
+
+    def test_budget_split_evenly_in_mb(self) -> None:
+        with mock.patch.dict(pool_module.SCRAPING_CONFIG, {"browser_memory_budget_mb": 1536}):
+            prefs = _memory_prefs(3)
+        self.assertEqual(prefs["javascript.options.mem.max"], 512)
+        self.assertEqual(prefs["browser.cache.memory.capacity"], pool_module.MEMORY_CACHE_KB)
+
+    def test_cache_capped_by_small_share(self) -> None:
+        with mock.patch.dict(pool_module.SCRAPING_CONFIG, {"browser_memory_budget_mb": 20}):
+            prefs = _memory_prefs(2)
+        self.assertEqual(prefs["javascript.options.mem.max"], 10)
+        self.assertEqual(prefs["browser.cache.memory.capacity"], 10 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()